@@ -36,43 +36,104 @@ Works with most (any?) Plantower UART or I2C interfaced PM2.5 sensor.
 """
 
 import struct
+import time
+
+try:
+    # Used only for typing
+    from typing import Optional
+    from digitalio import DigitalInOut
+except ImportError:
+    pass
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_PM25.git"
 
+# the start characters and frame length of a packet
+_HEADER_FMT = ">HH"
+# the 12 data words of a packet, in the order they are sent
+_FRAME_FMT = ">12H"
+_KEYS = (
+    "pm10 standard",
+    "pm25 standard",
+    "pm100 standard",
+    "pm10 env",
+    "pm25 env",
+    "pm100 env",
+    "particles 03um",
+    "particles 05um",
+    "particles 10um",
+    "particles 25um",
+    "particles 50um",
+    "particles 100um",
+)
+
+# seconds a packet may be reused before a real read is done regardless,
+# a bit over the sensor's slowest interval between packets
+_MAX_PACKET_AGE = 3
+
+
+def _reset_device(pin: Optional["DigitalInOut"], warmup: float = 1.0) -> None:
+    """Pulse the reset pin of the sensor, if there is one, and give it
+    warmup seconds to start up again"""
+    if pin is None:
+        return
+    pin.switch_to_output(value=False)
+    time.sleep(0.01)
+    pin.value = True
+    time.sleep(warmup)
+
+
+def _validate(packet: memoryview) -> None:
+    """Check the header, frame length and checksum of a 32 byte packet,
+    raising `RuntimeError` if any of them are wrong"""
+    # check packet header ("BM") and frame length
+    header, frame_len = struct.unpack_from(_HEADER_FMT, packet, 0)
+    if header != 0x424D:
+        raise RuntimeError("Invalid PM2.5 header")
+    if frame_len != 28:
+        raise RuntimeError("Invalid PM2.5 frame length")
+
+    # sum() over a memoryview runs in C, with no copy of the packet
+    if sum(packet[:30]) != (packet[30] << 8) | packet[31]:
+        raise RuntimeError("Invalid PM2.5 checksum")
+
 
 class PM25:
     """
     Super-class for generic PM2.5 sensors.
 
     .. note::
-        Subclasses must implement _read_into_buffer to fill self._buffer with a packet of data
+        Subclasses must implement _read_into_buffer to fill self._buffer with a packet of data,
+        and may override _frame_available to report when no new packet has arrived yet.
+        Write into self._buffer (or self._mv) in place rather than assigning a new buffer,
+        as self._mv is a memoryview of it made once in __init__
 
     """
 
     def __init__(self) -> None:
         # rad, ok make our internal buffer!
         self._buffer = bytearray(32)
-        self.aqi_reading = {
-            "pm10 standard": None,
-            "pm25 standard": None,
-            "pm100 standard": None,
-            "pm10 env": None,
-            "pm25 env": None,
-            "pm100 env": None,
-            "particles 03um": None,
-            "particles 05um": None,
-            "particles 10um": None,
-            "particles 25um": None,
-            "particles 50um": None,
-            "particles 100um": None,
-        }
+        # lets us unpack and sum parts of the buffer without copying them
+        self._mv = memoryview(self._buffer)
+        # filled in by the first successful read()
+        self.aqi_reading = None
+        self._raw_reading = None
+        # bumped for every packet read, so we only parse each packet once
+        self._frame_stamp = 0
+        self._last_parsed_stamp = -1
+        # stamp of the packet aqi_reading was last filled from
+        self._dict_stamp = -1
+        self._frame_time = 0
 
     def _read_into_buffer(self) -> None:
         """Low level buffer filling function, to be overridden"""
         raise NotImplementedError()
 
-    def read(self) -> dict:
+    def _frame_available(self) -> bool:  # pylint: disable=no-self-use
+        """Whether a new packet can be read, may be overridden"""
+        return True
+
+    def read(self, force: bool = False) -> dict:
         """Read any available data from the air quality sensor and
         return a dictionary with available particulate/quality data
 
@@ -80,38 +141,51 @@ class PM25:
         standard atmospheric conditions (288.15 K, 1013.25 hPa), and
         "environmental" concentrations are those measure in the current
         atmospheric conditions.
+
+        If the sensor has not sent a new packet since the last call, this
+        may return the previous reading again. Once that reading is a few
+        seconds old a new packet is always read, raising `RuntimeError` if
+        the sensor does not send one.
+
+        :param bool force: Always read a new packet, even if the sensor has not
+         sent one since the last reading. Defaults to `False`
         """
-        self._read_into_buffer()
-        # print([hex(i) for i in self._buffer])
-
-        # check packet header
-        if not self._buffer[0:2] == b"BM":
-            raise RuntimeError("Invalid PM2.5 header")
-
-        # check frame length
-        frame_len = struct.unpack(">H", self._buffer[2:4])[0]
-        if frame_len != 28:
-            raise RuntimeError("Invalid PM2.5 frame length")
-
-        checksum = struct.unpack(">H", self._buffer[30:32])[0]
-        check = sum(self._buffer[0:30])
-        if check != checksum:
-            raise RuntimeError("Invalid PM2.5 checksum")
-
-        # unpack data
-        (
-            self.aqi_reading["pm10 standard"],
-            self.aqi_reading["pm25 standard"],
-            self.aqi_reading["pm100 standard"],
-            self.aqi_reading["pm10 env"],
-            self.aqi_reading["pm25 env"],
-            self.aqi_reading["pm100 env"],
-            self.aqi_reading["particles 03um"],
-            self.aqi_reading["particles 05um"],
-            self.aqi_reading["particles 10um"],
-            self.aqi_reading["particles 25um"],
-            self.aqi_reading["particles 50um"],
-            self.aqi_reading["particles 100um"],
-        ) = struct.unpack(">HHHHHHHHHHHH", self._buffer[4:28])
+        values = self.read_raw(force)
+        if self._dict_stamp != self._last_parsed_stamp:
+            if self.aqi_reading is None:
+                self.aqi_reading = dict(zip(_KEYS, values))
+            else:
+                self.aqi_reading.update(zip(_KEYS, values))
+            self._dict_stamp = self._last_parsed_stamp
 
         return self.aqi_reading
+
+    def read_raw(self, force: bool = False) -> tuple:
+        """Read any available data from the air quality sensor and
+        return the 12 values of the packet as a tuple, without building
+        a dictionary. The values are in the same order as the keys of
+        `read`: pm10, pm25 and pm100 standard, pm10, pm25 and pm100 env,
+        then particles 03um, 05um, 10um, 25um, 50um and 100um.
+
+        Like `read`, this may return the previous values again if the
+        sensor has not sent a new packet since.
+
+        :param bool force: Always read a new packet, even if the sensor has not
+         sent one since the last reading. Defaults to `False`
+        """
+        if (
+            force
+            or self._last_parsed_stamp != self._frame_stamp
+            or self._frame_available()
+            or time.monotonic() - self._frame_time > _MAX_PACKET_AGE
+        ):
+            self._read_into_buffer()
+            self._frame_stamp += 1
+            self._frame_time = time.monotonic()
+        if self._last_parsed_stamp != self._frame_stamp:
+            # print([hex(i) for i in self._buffer])
+            _validate(self._mv)
+            self._raw_reading = struct.unpack_from(_FRAME_FMT, self._mv, 4)
+            self._last_parsed_stamp = self._frame_stamp
+
+        return self._raw_reading
@@ -35,9 +35,9 @@ Works with most (any?) Plantower I2C interfaced PM2.5 sensor.
 
 # imports
 import time
-from digitalio import Direction, DigitalInOut
+from digitalio import DigitalInOut
 from adafruit_bus_device.i2c_device import I2CDevice
-from . import PM25
+from . import PM25, _reset_device
 
 try:
     # Used only for typing
@@ -87,14 +87,8 @@ class PM25_I2C(PM25):
     def __init__(
         self, i2c_bus: I2C, reset_pin: DigitalInOut = None, address: int = 0x12
     ) -> None:
-        if reset_pin:
-            # Reset device
-            reset_pin.direction = Direction.OUTPUT
-            reset_pin.value = False
-            time.sleep(0.01)
-            reset_pin.value = True
-            # it takes at least a second to start up
-            time.sleep(1)
+        # it takes at least a second to start up after a reset
+        _reset_device(reset_pin)
 
         for _ in range(5):  # try a few times, it can be sluggish
             try:
@@ -29,9 +29,8 @@ Works with most (any?) Plantower UART or I2C interfaced PM2.5 sensor.
 
 """
 
-import time
-from digitalio import Direction, DigitalInOut
-from . import PM25
+from digitalio import DigitalInOut
+from . import PM25, _reset_device
 
 try:
     # Used only for typing
@@ -81,28 +80,47 @@ class PM25_UART(PM25):
     """
 
     def __init__(self, uart: UART, reset_pin: DigitalInOut = None):
-        if reset_pin:
-            # Reset device
-            reset_pin.direction = Direction.OUTPUT
-            reset_pin.value = False
-            time.sleep(0.01)
-            reset_pin.value = True
-            # it takes at least a second to start up
-            time.sleep(1)
+        # it takes at least a second to start up after a reset
+        _reset_device(reset_pin)
 
         self._uart = uart
         super().__init__()
 
+    def _frame_available(self) -> bool:
+        return self._uart.in_waiting >= 32
+
     def _read_into_buffer(self) -> None:
+        read = self._uart.readinto(self._buffer)
+        if read == 32 and self._buffer[0] == 0x42 and self._buffer[1] == 0x4D:
+            # already lined up with the sensor's frames, the usual case
+            return
+        self._resync(read or 0)
+
+    def _resync(self, count: int) -> None:
+        """Find the start of frame in the first count bytes of the buffer,
+        then read in the rest of the packet"""
+        buf = self._buffer
+        # allow for a cut off frame plus one garbled by an overflowed RX buffer
+        discarded = 0
         while True:
-            b = self._uart.read(1)
-            if not b:
+            # find the start of frame, which may be cut off after the first byte
+            start = 0
+            while start < count and (
+                buf[start] != 0x42 or (start + 1 < count and buf[start + 1] != 0x4D)
+            ):
+                start += 1
+            if start:
+                discarded += start
+                if discarded > 64:
+                    raise RuntimeError("Unable to read from PM2.5 (no start of frame)")
+                # drop whatever came before it
+                buf[: count - start] = buf[start:count]
+                count -= start
+            elif count == 32:
+                return
+            read = self._uart.readinto(self._mv[count:])
+            if not read:
+                if count:
+                    raise RuntimeError("Unable to read from PM2.5 (incomplete frame)")
                 raise RuntimeError("Unable to read from PM2.5 (no start of frame)")
-            if b[0] == 0x42:
-                break
-        self._buffer[0] = b[0]  # first byte and start of frame
-
-        remain = self._uart.read(31)
-        if not remain or len(remain) != 31:
-            raise RuntimeError("Unable to read from PM2.5 (incomplete frame)")
-        self._buffer[1:] = remain
+            count += read